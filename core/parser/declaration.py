@@ -4,9 +4,20 @@ import core.parser.utils as p
 from core import tokens as tks
 import core.tree.decl_nodes as decl_nodes
 import core.tree.nodes as nodes
-from core.parser.expression import parse_expression
+from core.parser.expression import parse_expression, parse_assignment
 from core.parser.utils import (add_range, ParserError, match_token, token_is,
-                                 raise_error, log_error, token_in)
+                                 raise_error)
+
+
+_TYPE_SPECS = frozenset(ctypes.simple_types.keys())
+# Empty until core/tokens.py defines qualifier and storage class keywords.
+_TYPE_QUALS = frozenset()
+_STORAGE_SPECS = frozenset()
+
+_TYPE_SPEC_MASK = sum(1 << kind.id for kind in _TYPE_SPECS)
+_TYPE_QUAL_MASK = sum(1 << kind.id for kind in _TYPE_QUALS)
+_STORAGE_SPEC_MASK = sum(1 << kind.id for kind in _STORAGE_SPECS)
+_DECL_SPEC_MASK = _TYPE_SPEC_MASK | _TYPE_QUAL_MASK | _STORAGE_SPEC_MASK
 
 
 @add_range
@@ -29,9 +40,7 @@ def parse_declaration(index):
 @add_range
 def parse_abstract_declarator(index):
     root, index = parse_declarator(index)
-    node = root
-    while not isinstance(node, decl_nodes.Identifier):
-        node = node.child
+    node = root.leaf
 
     if node.identifier:
         err = "expected abstract declarator, but identifier name was provided"
@@ -53,7 +62,6 @@ def parse_decls_inits(index, parse_inits=True):
         # decls.append(node)
 
         if token_is(index, tks.equals) and parse_inits:
-            from core.parser.expression import parse_assignment
             expr, index = parse_assignment(index + 1)
             inits.append(expr)
         else:
@@ -70,12 +78,10 @@ def parse_decls_inits(index, parse_inits=True):
     return node, index
 
 def parse_decl_specifiers(index, _spec_qual=False):
-    type_specs = set(ctypes.simple_types.keys())
-
-    type_quals = {}
-
-    storage_specs = {}
-
+    tokens = p.tokens
+    kind_ids = p.kind_ids
+    num_tokens = len(kind_ids)
+    identifier = tks.identifier.id
     specs = []
 
     SIMPLE = 1
@@ -84,28 +90,31 @@ def parse_decl_specifiers(index, _spec_qual=False):
     type_spec_class = None
 
     while True:
+        kind = kind_ids[index] if index < num_tokens else None
+        bit = 1 << kind if kind is not None else 0
+
         if (not type_spec_class
-              and token_is(index, tks.identifier)
-              and p.symbols.is_typedef(p.tokens[index])):
-            specs.append(p.tokens[index])
+              and kind == identifier
+              and p.symbols.is_typedef(tokens[index])):
+            specs.append(tokens[index])
             index += 1
             type_spec_class = TYPEDEF
 
-        elif type_spec_class in {None, SIMPLE} and token_in(index, type_specs):
-            specs.append(p.tokens[index])
+        elif type_spec_class in {None, SIMPLE} and bit & _TYPE_SPEC_MASK:
+            specs.append(tokens[index])
             index += 1
             type_spec_class = SIMPLE
 
-        elif token_in(index, type_quals):
-            specs.append(p.tokens[index])
+        elif bit & _TYPE_QUAL_MASK:
+            specs.append(tokens[index])
             index += 1
 
-        elif token_in(index, storage_specs):
+        elif bit & _STORAGE_SPEC_MASK:
             if not _spec_qual:
-                specs.append(p.tokens[index])
+                specs.append(tokens[index])
             else:
                 err = "storage specifier not permitted here"
-                error_collector.add(CompilerError(err, p.tokens[index].r))
+                error_collector.add(CompilerError(err, tokens[index].r))
             index += 1
 
         else:
@@ -117,5 +126,21 @@ def parse_decl_specifiers(index, _spec_qual=False):
         raise_error("expected declaration specifier", index, ParserError.AT)
 
 
+def is_decl_specifier(index):
+    """Return true if the token at index can begin a declaration specifier.
+
+    Lets callers skip a speculative declaration parse that is bound to fail.
+
+    """
+    kind_ids = p.kind_ids
+    if index >= len(kind_ids):
+        return False
+
+    kind = kind_ids[index]
+    return bool((1 << kind) & _DECL_SPEC_MASK
+                or (kind == tks.identifier.id
+                    and p.symbols.is_typedef(p.tokens[index])))
+
+
 def parse_spec_qual_list(index):
     return parse_decl_specifiers(index, True)
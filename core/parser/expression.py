@@ -5,7 +5,7 @@ import core.parser.utils as p
 import core.tree.expr_nodes as expr_nodes
 import core.tree.decl_nodes as decl_nodes
 from core.parser.utils import (add_range, match_token, token_is, ParserError,
-                                 raise_error, log_error, token_in)
+                                 raise_error, token_in)
 
 @add_range
 def parse_expression(index):
@@ -89,10 +89,11 @@ def parse_multiplicative(index):
 @add_range
 def parse_cast(index):
     from core.parser.declaration import (
-        parse_abstract_declarator, parse_spec_qual_list)
+        parse_abstract_declarator, parse_spec_qual_list, is_decl_specifier)
 
-    with log_error():
-        match_token(index, tks.l_paren, ParserError.AT)
+    # A parenthesis that opens a type name can only start a cast here, so
+    # parse it directly and let any error through instead of speculating.
+    if token_is(index, tks.l_paren) and is_decl_specifier(index + 1):
         specs, index = parse_spec_qual_list(index + 1)
         node, index = parse_abstract_declarator(index)
         match_token(index, tks.r_paren, ParserError.AT)
@@ -8,7 +8,7 @@ from core.parser.expression import parse_assignment
 
 def parse(tokens_to_parse):
     p.best_error = None
-    p.tokens = tokens_to_parse
+    p.set_tokens(tokens_to_parse)
 
     with log_error():
         return parse_root(0)[0]
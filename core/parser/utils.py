@@ -1,4 +1,5 @@
 
+from array import array
 from contextlib import contextmanager
 import copy
 
@@ -6,6 +7,18 @@ from core.errors import CompilerError, Range
 
 tokens = None
 
+# Kind id of each token in `tokens`, stored contiguously so hot scans do not
+# have to go through the Token objects. Only valid if `tokens` is set through
+# set_tokens().
+kind_ids = None
+
+
+def set_tokens(new_tokens):
+    """Set the tokens to parse, along with their parallel array of kind ids."""
+    global tokens, kind_ids
+    tokens = new_tokens
+    kind_ids = array("H", (token.kind.id for token in new_tokens))
+
 class SimpleSymbolTable:
     def __init__(self):
         self.symbols = []
@@ -93,7 +106,7 @@ def log_error():
 def token_is(index, kind):
     """Return true if the next token is of the given kind."""
     global tokens
-    return len(tokens) > index and tokens[index].kind == kind
+    return len(tokens) > index and tokens[index].kind is kind
 
 
 def token_in(index, kinds):
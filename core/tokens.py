@@ -1,9 +1,15 @@
 
 class TokenKind:
 
+    # Number of kinds created so far; each kind gets the next small integer
+    # as its id, so sets of kinds can be tested as bitmasks.
+    count = 0
+
     def __init__(self, text_repr="", kinds=[]):
 
         self.text_repr = text_repr
+        self.id = TokenKind.count
+        TokenKind.count += 1
         kinds.append(self)
         kinds.sort(key=lambda kind: -len(kind.text_repr))
 
@@ -1,7 +1,10 @@
 class DeclNode:
-    pass
+    """Declarator nodes expose `leaf`, the innermost Identifier."""
+    __slots__ = ("r",)
 
 class Root(DeclNode):
+    __slots__ = ("specs", "decls", "inits")
+
     def __init__(self, specs, decls, inits=None):
         self.specs = specs
         self.decls = decls
@@ -14,18 +17,32 @@ class Root(DeclNode):
         super().__init__()
 
 class Pointer(DeclNode):
+    __slots__ = ("child", "const", "leaf")
+
     def __init__(self, child, const):
+        # child must not be reassigned after construction, or leaf goes stale
         self.child = child
+        self.leaf = child.leaf
         self.const = const
         super().__init__()
 
 class Array(DeclNode):
+    __slots__ = ("n", "child", "leaf")
+
     def __init__(self, n, child):
         self.n = n
+        # child must not be reassigned after construction, or leaf goes stale
         self.child = child
+        self.leaf = child.leaf
         super().__init__()
 
 class Identifier(DeclNode):
+    __slots__ = ("identifier",)
+
     def __init__(self, identifier):
         self.identifier = identifier
         super().__init__()
+
+    @property
+    def leaf(self):
+        return self